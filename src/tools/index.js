@@ -83,47 +83,9 @@ import { enhanceAllTools } from './enhance-tools.js';
  * @param {Object} server - The LettaServer instance (should likely be typed more specifically if possible)
  */
 export function registerToolHandlers(server) {
-    // Collect all tool definitions
-    const allTools = [
-        listAgentsToolDefinition,
-        promptAgentToolDefinition,
-        listAgentToolsDefinition,
-        createAgentToolDefinition,
-        attachToolToolDefinition,
-        listMemoryBlocksToolDefinition,
-        readMemoryBlockToolDefinition,
-        updateMemoryBlockToolDefinition,
-        attachMemoryBlockToolDefinition,
-        createMemoryBlockToolDefinition,
-        uploadToolToolDefinition,
-        listMcpToolsByServerDefinition,
-        listMcpServersDefinition,
-        retrieveAgentDefinition,
-        modifyAgentDefinition,
-        deleteAgentDefinition,
-        listLlmModelsDefinition,
-        listEmbeddingModelsDefinition,
-        listPassagesDefinition,
-        createPassageDefinition,
-        modifyPassageDefinition,
-        deletePassageDefinition,
-        exportAgentDefinition,
-        importAgentDefinition,
-        cloneAgentDefinition,
-        bulkAttachToolDefinition,
-        getAgentSummaryDefinition,
-        bulkDeleteAgentsDefinition,
-        addMcpToolToLettaDefinition,
-        listPromptsToolDefinition,
-        usePromptToolDefinition,
-    ];
-
-    // Enhance all tools with output schemas and improved descriptions
-    const enhancedTools = enhanceAllTools(allTools);
-
     // Register tool definitions
     server.server.setRequestHandler(ListToolsRequestSchema, async () => ({
-        tools: enhancedTools,
+        tools: toolDefinitions,
     }));
 
     // Register tool call handler
@@ -200,7 +162,7 @@ export function registerToolHandlers(server) {
     });
 }
 
-// Export all tool definitions (enhanced)
+// Export all tool definitions (enhanced once at import time)
 export const toolDefinitions = enhanceAllTools([
     listAgentsToolDefinition,
     promptAgentToolDefinition,